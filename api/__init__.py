@@ -1,25 +1,26 @@
 # Copyright (c) 2024 by Jonathan AW
 # api/__init__.py
 
-from flask import Flask, g, jsonify
+from flask import Flask, current_app, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+# orjson is installed in the deployment image (see Dockerfile); fall back to Flask's
+# stdlib-based provider when it is not available so local tooling keeps working.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from flask_marshmallow import Marshmallow
 from marshmallow import ValidationError
 from flask_jwt_extended import JWTManager
 from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
-from api.routes.applicants import applicants_bp
-from api.routes.schemes import schemes_bp
-from api.routes.applications import applications_bp
-from api.routes.auth import auth_bp  
 from config import Config
 from dal.database import Base  # Import your Base model
 
 import logging
 
-# Import the Swagger setup function
-from api.swagger_setup import init_swagger_ui
-
 # Initialize extensions
 ma = Marshmallow()
 jwt = JWTManager()
@@ -29,29 +30,88 @@ load_dotenv()
 from environs import Env
 
 # Load environment variables
-DATABASE_URL = Env().str("DATABASE_URL", "DATABASE_URL is not set.") 
-api_engine = create_engine(DATABASE_URL)
+DATABASE_URL = Env().str("DATABASE_URL", "DATABASE_URL is not set.")
+
+# Opt-in cooperative DB I/O for gevent deployments, e.g.
+#   GEVENT_PATCH_PSYCOPG=1 gunicorn -k gevent -w 4 --worker-connections 1000 'api:create_app()'
+# patch_psycopg installs psycopg2's wait callback so greenlets yield during DB socket I/O;
+# it must run before the engine below creates any connections.
+if Env().bool("GEVENT_PATCH_PSYCOPG", False):
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
+# Explicit connection pool tuning. pool_pre_ping validates connections on checkout so stale
+# connections are replaced instead of surfacing as errors; pool_recycle guards against the
+# database server closing idle connections from under the pool.
+api_engine = create_engine(
+    DATABASE_URL,
+    pool_size=int(Env().str("DB_POOL_SIZE", "10")),
+    max_overflow=int(Env().str("DB_MAX_OVERFLOW", "20")),
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 api_SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=api_engine))
 
+# Route modules use the scoped session registry above, so they must be imported after it is defined
+from api.routes.applicants import applicants_bp
+from api.routes.schemes import schemes_bp
+from api.routes.applications import applications_bp
+from api.routes.auth import auth_bp
+
+# Import the Swagger setup function
+from api.swagger_setup import init_swagger_ui
+
 def setup_db_session(app):
     """Setup SQLAlchemy sessions for the app."""
 
-    @app.before_request
-    def create_session():
-        """Create a new database session for a request."""
-        g.db_session = api_SessionLocal() # Note: This is a normal session, not a scoped_session
-
     @app.teardown_appcontext
     def remove_session(exception=None):
-        """Remove the database session after the request ends."""
-        db_session = g.pop('db_session', None)
-        if db_session is not None:
-            db_session.close() # Use close() instead of remove() for regular session
+        """Release the thread-local database session after the request ends."""
+        api_SessionLocal.remove() # Let the scoped_session registry manage the session lifecycle
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's C encoder instead of the pure-Python json module.
+
+    Datetimes are passed through to DefaultJSONProvider.default so response
+    formatting stays identical to Flask's stock provider; keys are not sorted.
+    """
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_PASSTHROUGH_DATETIME).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Error handlers are defined once at module level; create_app runs per worker (and per
+# test app), so defining them as closures there would re-allocate the function objects
+# on every call.
+
+# # Error handler for Marshmallow validation errors
+# def handle_marshmallow_validation_error(e):
+#     current_app.logger.error(f"Marshmallow Validation Error: {e}")
+#     return jsonify({"errors": e.messages}), 400
+
+def handle_sqlalchemy_error(e):
+    """Error handler for SQLAlchemy errors."""
+    # Rollback the session to prevent any potential side effects
+    api_SessionLocal().rollback()  # Proxy returns the thread-local session
+    current_app.logger.error(f"SQLAlchemy Error: {e}")
+    return jsonify({"error": "A database error occurred."}), 500
+
+def handle_generic_error(e):
+    """General error handler."""
+    current_app.logger.error(f"Unhandled Exception: {e}")
+    return jsonify({"error": str(e)}), 500
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
 
+    # Serialize all jsonify/response bodies with orjson when available
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
     # Initialize extensions with app
     ma.init_app(app)
     jwt.init_app(app)
@@ -69,33 +129,21 @@ def create_app(config_class=Config):
     init_swagger_ui(app)
 
 
-    # # Error handler for Marshmallow validation errors
-    # @app.errorhandler(ValidationError)
-    # def handle_marshmallow_validation_error(e):
-    #     app.logger.error(f"Marshmallow Validation Error: {e}")
-    #     return jsonify({"errors": e.messages}), 400
-
-    # Error handler for SQLAlchemy errors
-    @app.errorhandler(SQLAlchemyError)
-    def handle_sqlalchemy_error(e):
-        # Rollback the session to prevent any potential side effects
-        session = g.get('db_session')
-        if session is not None:
-            session.rollback()  # Properly rollback the session
-        app.logger.error(f"SQLAlchemy Error: {e}")
-        return jsonify({"error": "A database error occurred."}), 500
-
-    # General error handler
-    @app.errorhandler(Exception)
-    def handle_generic_error(e):
-        app.logger.error(f"Unhandled Exception: {e}")
-        return jsonify({"error": str(e)}), 500
-    
-    return app
+    # Register the module-level error handlers
+    # app.register_error_handler(ValidationError, handle_marshmallow_validation_error)
+    app.register_error_handler(SQLAlchemyError, handle_sqlalchemy_error)
+    app.register_error_handler(Exception, handle_generic_error)
 
+    # One-shot schema provisioning, run explicitly at deploy time (`flask init-db`).
+    # Keeping DDL out of import/boot means worker processes never pay a round of
+    # table introspection on fork, and the app can be imported without a database.
+    @app.cli.command("init-db")
+    def init_db():
+        """Create the database tables from the ORM model definitions (idempotent)."""
+        from dal.models import Applicant, HouseholdMember, Scheme, Application, Administrator  # Ensure models are registered on Base
+        Base.metadata.create_all(bind=api_engine)
 
-# from dal.models import Applicant,HouseholdMember, Scheme, Application, Administrator  # Import our ORM models
-# Base.metadata.create_all(bind=api_engine) # Ensure our database tables are created based on the definition of our ORM Models (Idempotent operation)
+    return app
 
 # Setup logging
 logging.basicConfig(level=logging.DEBUG)  # Set to DEBUG to capture more details
\ No newline at end of file
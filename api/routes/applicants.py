@@ -50,7 +50,8 @@ By addressing these points, the codebase demonstrates strong adherence to non-fu
 
 # api/routes/applicants.py
 
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, request, jsonify
+from api import api_SessionLocal
 from bl.services.applicant_service import ApplicantService
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from marshmallow import ValidationError
@@ -65,7 +66,7 @@ applicants_bp = Blueprint('applicants', __name__)
 @applicants_bp.route('/api/applicants', methods=['GET'])
 @jwt_required()
 def get_applicants():
-    session = g.db_session  # Get the session from Flask's g object
+    session = api_SessionLocal()  # Thread-local session from the scoped_session registry
     crud_operations = CRUDOperations(session)
     
     # Extract pagination and sorting parameters from the request
@@ -125,7 +126,7 @@ def create_applicant():
     Endpoint to create a new applicant along with their household members.
     Automatically assigns the created_by_admin_id from the JWT token to ensure security.
     """
-    session = g.db_session  # Get the session from Flask's g object
+    session = api_SessionLocal()  # Thread-local session from the scoped_session registry
     crud_operations = CRUDOperations(session)
     applicant_service = ApplicantService(crud_operations)
     try:
@@ -49,7 +49,8 @@ By addressing these points, the codebase demonstrates strong adherence to non-fu
 
 # api/routes/applications.py
 
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, request, jsonify
+from api import api_SessionLocal
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from bl.services.application_service import ApplicationService
 from api.schemas.all_schemas import ApplicationSchema
@@ -65,7 +66,7 @@ applications_bp = Blueprint('applications', __name__)
 @applications_bp.route('/api/applications', methods=['GET'])
 @jwt_required()
 def get_applications():
-    session = g.db_session  # Get the session from Flask's g object
+    session = api_SessionLocal()  # Thread-local session from the scoped_session registry
     crud_operations = CRUDOperations(session)
     
     # Extract pagination and sorting parameters from the request
@@ -108,7 +109,7 @@ def get_applications():
 @applications_bp.route('/api/applications', methods=['POST'])
 @jwt_required()
 def create_application():
-    session = g.db_session  # Get the session from Flask's g object
+    session = api_SessionLocal()  # Thread-local session from the scoped_session registry
     crud_operations = CRUDOperations(session)
     application_service = ApplicationService(crud_operations)
     schemeEligibilityCheckerFactory = SchemeEligibilityCheckerFactory(session) 
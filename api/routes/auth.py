@@ -1,6 +1,7 @@
 # api/routes/auth.py
 
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, request, jsonify
+from api import api_SessionLocal
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
 from dal.crud_operations import CRUDOperations
 from bl.services.administrator_service import AdministratorService
@@ -16,7 +17,7 @@ def login():
     Requires JSON payload with 'username' and 'password'.
     Returns a JWT access token if authentication is successful.
     """
-    session = g.db_session  # Get the session from Flask's g object
+    session = api_SessionLocal()  # Thread-local session from the scoped_session registry
     crud_operations = CRUDOperations(session)
     administrator_service = AdministratorService(crud_operations)
 
@@ -51,7 +52,7 @@ def reset_admin_password():
     Expects JSON payload with 'target_username'.
     Returns the new generated password.
     """
-    session = g.db_session
+    session = api_SessionLocal()
     crud_operations = CRUDOperations(session)
     administrator_service = AdministratorService(crud_operations)
 
@@ -50,7 +50,8 @@ By addressing these points, the codebase demonstrates strong adherence to non-fu
 
 # api/routes/schemes.py
 
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, request, jsonify
+from api import api_SessionLocal
 from flask_jwt_extended import jwt_required
 from bl.services.scheme_service import SchemeService
 from api.schemas.all_schemas import SchemeSchema
@@ -71,7 +72,7 @@ def get_schemes():
     """
     Endpoint to retrieve all schemes with optional filtering and pagination.
     """
-    session = g.db_session  # Get the session from Flask's g object
+    session = api_SessionLocal()  # Thread-local session from the scoped_session registry
     crud_operations = CRUDOperations(session)
     scheme_service = SchemeService(crud_operations)
 
@@ -138,7 +139,7 @@ def get_eligible_schemes():
     if not applicant_id.isdigit():  # Add validation for applicant_id
         return jsonify({"error": "Invalid applicant id format"}), 400
 
-    session = g.db_session  # Get the session from Flask's g object
+    session = api_SessionLocal()  # Thread-local session from the scoped_session registry
     crud_operations = CRUDOperations(session)
     try:
         applicant = ApplicantService(crud_operations).get_applicant_by_id(applicant_id)
@@ -0,0 +1,17 @@
+# Copyright (c) 2024 by Jonathan AW
+# asgi.py
+# Purpose: ASGI entry point for the Flask application.
+#
+# The admin endpoints are dominated by database round-trips, so serving the app through an
+# ASGI server lets a single event loop multiplex many in-flight requests instead of tying
+# up one worker thread per blocked request. WsgiToAsgi runs the unchanged WSGI app in a
+# thread-pool executor, so no route code needs to change.
+#
+# Run with:
+#   poetry run uvicorn asgi:asgi_app --host 0.0.0.0 --port 5000 --workers 4
+
+from asgiref.wsgi import WsgiToAsgi
+
+from api import create_app
+
+asgi_app = WsgiToAsgi(create_app())
@@ -74,3 +74,26 @@ class BaseEligibility(ABC):
         """
         pass
 
+    def compile_check(self):
+        """
+        Return an eligibility predicate specialized for this strategy's scheme.
+
+        A scheme's criteria constants are fixed at configuration time, so
+        strategies can partially evaluate their rules here - reading the
+        thresholds out of the scheme JSON once and returning a closure with the
+        constants already bound - leaving per-applicant calls with no config
+        traversal. The default simply returns the bound check_eligibility method.
+        """
+        return self.check_eligibility
+
+    def check_eligibility_batch(self, applicants: List[Applicant]) -> List[tuple[bool, str]]:
+        """
+        Check eligibility for a batch of applicants in one call.
+
+        The default implementation evaluates applicants one at a time. Subclasses
+        whose criteria reduce to arithmetic over a few applicant fields can
+        override this with a columnar implementation (e.g. NumPy boolean masks
+        over age/income arrays) without changing any caller.
+        """
+        return [self.check_eligibility(applicant) for applicant in applicants]
+
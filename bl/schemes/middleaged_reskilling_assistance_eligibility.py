@@ -75,6 +75,7 @@ class MiddleagedReskillingAssistanceEligibility(BaseEligibility):
 
     def __init__(self, scheme: Scheme):
         self.scheme = scheme
+        self.__compiled_check = None
 
     def check_eligibility(self, applicant: Applicant) -> tuple[bool, str]:
         """
@@ -84,15 +85,27 @@ class MiddleagedReskillingAssistanceEligibility(BaseEligibility):
         - The applicant must be 40 years or older.
         - The applicant must be unemployed.
         """
-        eligibility_criteria = self.scheme.eligibility_criteria
-        age_threshold = eligibility_criteria.get("age_threshold")
-        required_employment_status = eligibility_criteria.get("employment_status")
-
-        applicant_age = calculate_age(applicant.date_of_birth)
-        if applicant_age >= age_threshold and applicant.employment_status == required_employment_status:
-            return True, "Eligible for Middle-aged Reskilling Assistance."
-        
-        return False, "Not eligible for Middle-aged Reskilling Assistance."
+        return self.compile_check()(applicant)
+
+    def compile_check(self):
+        """
+        Return the eligibility predicate specialized to this scheme's configured
+        age threshold and employment status, building it on first use.
+        """
+        if self.__compiled_check is None:
+            eligibility_criteria = self.scheme.eligibility_criteria
+            age_threshold = eligibility_criteria.get("age_threshold")
+            required_employment_status = eligibility_criteria.get("employment_status")
+
+            def check_eligibility_compiled(applicant: Applicant) -> tuple[bool, str]:
+                applicant_age = calculate_age(applicant.date_of_birth)
+                if applicant_age >= age_threshold and applicant.employment_status == required_employment_status:
+                    return True, "Eligible for Middle-aged Reskilling Assistance."
+
+                return False, "Not eligible for Middle-aged Reskilling Assistance."
+
+            self.__compiled_check = check_eligibility_compiled
+        return self.__compiled_check
 
     def calculate_benefits(self, applicant: Applicant) -> List[Dict[str, Any]]:
         """
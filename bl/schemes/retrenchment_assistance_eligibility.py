@@ -94,43 +94,57 @@ class RetrenchmentAssistanceEligibility(BaseEligibility):
 
     def __init__(self, scheme: Scheme):
         self.scheme = scheme
+        self.__compiled_check = None
 
     def check_eligibility(self, applicant: Applicant) -> tuple[bool, str]:
         """
         Determine if the applicant is eligible for retrenchment assistance.
-        
+
         Criteria:
         - The applicant must be unemployed.
         - The applicant must have become unemployed within the last 'X' months.
         """
-        eligibility_criteria = self.scheme.eligibility_criteria
-        required_employment_status = eligibility_criteria.get("employment_status")
-        retrenchment_period_months = eligibility_criteria.get("retrechment_period_months")
-        required_marital_status = eligibility_criteria.get("marital_status")
-        marriage_duration_months = eligibility_criteria.get("marriage_duration_months")
-
-        # Check employment status and retrenchment period
-        if applicant.employment_status == required_employment_status:
-            if applicant.employment_status_change_date:
-                if not is_within_last_months(applicant.employment_status_change_date, retrenchment_period_months):
-                    return False, "Not eligible: Retrenchment period exceeds the required duration."
-            else:
-                return False, "Not eligible: Missing employment status change date."
-        else:
-            return False, "Not eligible: Applicant is not unemployed."
-
-        # Check marital status and marriage duration
-        if applicant.marital_status != required_marital_status:
-            return False, "Not eligible: Applicant is not married."
-        
-        # Assuming there's a 'marriage_date' field in the Applicant model
-        if not hasattr(applicant, 'marriage_date') or applicant.marriage_date is None:
-            return False, "Not eligible: Missing marriage date information."
-        
-        if not is_within_last_months(applicant.marriage_date, marriage_duration_months):
-            return False, f"Not eligible: Marriage duration exceeds {marriage_duration_months} months."
-
-        return True, "Eligible for Retrenchment Assistance."
+        return self.compile_check()(applicant)
+
+    def compile_check(self):
+        """
+        Return the eligibility predicate specialized to this scheme's configured
+        criteria, building it on first use. The criteria constants are read from
+        the scheme JSON once, not per applicant.
+        """
+        if self.__compiled_check is None:
+            eligibility_criteria = self.scheme.eligibility_criteria
+            required_employment_status = eligibility_criteria.get("employment_status")
+            retrenchment_period_months = eligibility_criteria.get("retrechment_period_months")
+            required_marital_status = eligibility_criteria.get("marital_status")
+            marriage_duration_months = eligibility_criteria.get("marriage_duration_months")
+
+            def check_eligibility_compiled(applicant: Applicant) -> tuple[bool, str]:
+                # Check employment status and retrenchment period
+                if applicant.employment_status == required_employment_status:
+                    if applicant.employment_status_change_date:
+                        if not is_within_last_months(applicant.employment_status_change_date, retrenchment_period_months):
+                            return False, "Not eligible: Retrenchment period exceeds the required duration."
+                    else:
+                        return False, "Not eligible: Missing employment status change date."
+                else:
+                    return False, "Not eligible: Applicant is not unemployed."
+
+                # Check marital status and marriage duration
+                if applicant.marital_status != required_marital_status:
+                    return False, "Not eligible: Applicant is not married."
+
+                # Assuming there's a 'marriage_date' field in the Applicant model
+                if not hasattr(applicant, 'marriage_date') or applicant.marriage_date is None:
+                    return False, "Not eligible: Missing marriage date information."
+
+                if not is_within_last_months(applicant.marriage_date, marriage_duration_months):
+                    return False, f"Not eligible: Marriage duration exceeds {marriage_duration_months} months."
+
+                return True, "Eligible for Retrenchment Assistance."
+
+            self.__compiled_check = check_eligibility_compiled
+        return self.__compiled_check
 
     def calculate_benefits(self, applicant: Applicant) -> List[Dict[str, Any]]:
         if not self.check_eligibility(applicant)[0]:
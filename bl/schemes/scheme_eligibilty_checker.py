@@ -46,14 +46,36 @@ class SchemeEligibilityChecker:
         """
         self.scheme = scheme
         self.eligibility_definition = eligibility_definition
+        self._compiled_check = eligibility_definition.compile_check() # Predicate specialized to the scheme's constants at construction time
+        self._eligibility_cache: dict[int, tuple[bool, str]] = {} # Memoized results keyed by applicant.id; checkers live for one request
 
     def _check_eligibility(self, applicant: Applicant) -> tuple[bool, str]:
         """
         Check if the applicant is eligible for the scheme using the eligibility definition.
+        Results are memoized per applicant so _calculate_benefits does not re-run
+        the same predicates within a request.
         """
-        is_eligible, message = self.eligibility_definition.check_eligibility(applicant)
+        cache_key = getattr(applicant, 'id', None) # Applicant may be None or transient (no id yet)
+        if cache_key is not None and cache_key in self._eligibility_cache:
+            return self._eligibility_cache[cache_key]
+        is_eligible, message = self._compiled_check(applicant)
+        if cache_key is not None:
+            self._eligibility_cache[cache_key] = (is_eligible, message)
         return is_eligible, message
 
+    def _check_eligibility_batch(self, applicants: List[Applicant]) -> List[tuple[bool, str]]:
+        """
+        Check eligibility for a batch of applicants in one call, letting the
+        eligibility definition evaluate them together (vectorized where the
+        strategy supports it) instead of dispatching per applicant.
+        """
+        outcomes = self.eligibility_definition.check_eligibility_batch(applicants)
+        for applicant, outcome in zip(applicants, outcomes):
+            cache_key = getattr(applicant, 'id', None)
+            if cache_key is not None:
+                self._eligibility_cache[cache_key] = outcome
+        return outcomes
+
     def _calculate_benefits(self, applicant: Applicant) -> List[Dict[str, Any]]:
         """
         Calculate the benefits the applicant is eligible for under the scheme.
@@ -132,3 +132,30 @@ class SchemesManager:
             eligibility_message=message,
             eligible_benefits=eligible_benefits
         )
+
+    def check_scheme_eligibility_for_applicants(self, scheme: Scheme, applicant_ids: List[int]) -> Dict[int, EligibilityResult]:
+        """
+        Check a batch of applicants against one scheme.
+
+        The applicants are fetched in a single query with their household members
+        eager-loaded, and the scheme's eligibility checker is loaded once, so the
+        per-applicant work is pure in-memory evaluation with no lazy-load queries.
+        """
+        applicants = self.__crud_operations.get_applicants_by_ids(applicant_ids)
+        scheme_eligibility_checker = self.__schemeFactory.load_scheme_eligibility_checker(scheme)
+        eligibility_outcomes = scheme_eligibility_checker._check_eligibility_batch(applicants)
+
+        results = {}
+        for applicant, (is_eligible, message) in zip(applicants, eligibility_outcomes):
+            eligible_benefits = scheme_eligibility_checker._calculate_benefits(applicant) if is_eligible else []
+            results[applicant.id] = EligibilityResult(
+                scheme_id=scheme.id,
+                scheme_name=scheme.name,
+                scheme_description=scheme.description,
+                scheme_start_date=scheme.validity_start_date,
+                scheme_end_date=scheme.validity_end_date,
+                is_eligible=is_eligible,
+                eligibility_message=message,
+                eligible_benefits=eligible_benefits
+            )
+        return results
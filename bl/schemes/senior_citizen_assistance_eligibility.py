@@ -75,22 +75,34 @@ class SeniorCitizenAssistanceEligibility(BaseEligibility):
 
     def __init__(self, scheme: Scheme):
         self.__scheme = scheme
+        self.__compiled_check = None
 
     def check_eligibility(self, applicant: Applicant) -> tuple[bool, str]:
         """
         Determine if the applicant is eligible for senior citizen benefits.
-        
+
         Criteria:
         - The applicant must be 65 years or older.
         """
-        eligibility_criteria = self.__scheme.eligibility_criteria
-        age_threshold = eligibility_criteria.get("age_threshold")
+        return self.compile_check()(applicant)
+
+    def compile_check(self):
+        """
+        Return the eligibility predicate specialized to this scheme's configured
+        age threshold, building it on first use.
+        """
+        if self.__compiled_check is None:
+            age_threshold = self.__scheme.eligibility_criteria.get("age_threshold")
+
+            def check_eligibility_compiled(applicant: Applicant) -> tuple[bool, str]:
+                applicant_age = calculate_age(applicant.date_of_birth)
+                if applicant_age >= age_threshold:
+                    return True, "Eligible for Senior Citizen Assistance Scheme."
 
-        applicant_age = calculate_age(applicant.date_of_birth)
-        if applicant_age >= age_threshold:
-            return True, "Eligible for Senior Citizen Assistance Scheme."
+                return False, "Not eligible for Senior Citizen Assistance Scheme."
 
-        return False, "Not eligible for Senior Citizen Assistance Scheme."
+            self.__compiled_check = check_eligibility_compiled
+        return self.__compiled_check
 
     def calculate_benefits(self, applicant: Applicant) -> List[Dict[str, Any]]:
         """
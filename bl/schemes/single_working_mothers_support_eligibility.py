@@ -77,6 +77,7 @@ class SingleWorkingMothersSupportEligibility(BaseEligibility):
 
     def __init__(self, scheme: Scheme):
         self.__scheme = scheme
+        self.__compiled_check = None
 
     def check_eligibility(self, applicant: Applicant) -> tuple[bool, str]:
         """
@@ -88,30 +89,43 @@ class SingleWorkingMothersSupportEligibility(BaseEligibility):
         - The applicant must be {required_employment_status}.
         - The applicant must have at least one child {child_age_threshold} years old and below in their household.
         """
-        eligibility_criteria = self.__scheme.eligibility_criteria
-        required_sex = eligibility_criteria.get("sex")
-        required_marital_statuses = eligibility_criteria.get("marital_status")
-        required_employment_status = eligibility_criteria.get("employment_status")
-        child_age_threshold = eligibility_criteria.get("household_composition", {}).get("age_range", {}).get("age_threshold")
-
-        # Check if the applicant's sex matches the required sex
-        if applicant.sex != required_sex:
-            return False, "Not eligible: Applicant is not female."
-
-        # Check if the applicant's marital status is in the list of required statuses
-        if applicant.marital_status not in required_marital_statuses:
-            return False, "Not eligible: Applicant is not single, divorced, or widowed."
-
-        # Check if the applicant's employment status matches the required status
-        if applicant.employment_status != required_employment_status:
-            return False, "Not eligible: Applicant is not employed."
+        return self.compile_check()(applicant)
 
-        # Check if there is at least one child under 18 in the household
-        for member in applicant.household_members:
-            if member.relation == "child" and calculate_age(member.date_of_birth) <= child_age_threshold:
-                return True, "Eligible for Single Working Mothers Support Scheme."
-
-        return False, f"Not eligible: No child {child_age_threshold} years old or younger in the household."
+    def compile_check(self):
+        """
+        Return the eligibility predicate specialized to this scheme's configured
+        criteria, building it on first use. The criteria constants are read from
+        the scheme JSON once, not per applicant.
+        """
+        if self.__compiled_check is None:
+            eligibility_criteria = self.__scheme.eligibility_criteria
+            required_sex = eligibility_criteria.get("sex")
+            required_marital_statuses = eligibility_criteria.get("marital_status")
+            required_employment_status = eligibility_criteria.get("employment_status")
+            child_age_threshold = eligibility_criteria.get("household_composition", {}).get("age_range", {}).get("age_threshold")
+
+            def check_eligibility_compiled(applicant: Applicant) -> tuple[bool, str]:
+                # Check if the applicant's sex matches the required sex
+                if applicant.sex != required_sex:
+                    return False, "Not eligible: Applicant is not female."
+
+                # Check if the applicant's marital status is in the list of required statuses
+                if applicant.marital_status not in required_marital_statuses:
+                    return False, "Not eligible: Applicant is not single, divorced, or widowed."
+
+                # Check if the applicant's employment status matches the required status
+                if applicant.employment_status != required_employment_status:
+                    return False, "Not eligible: Applicant is not employed."
+
+                # Check if there is at least one child under 18 in the household
+                for member in applicant.household_members:
+                    if member.relation == "child" and calculate_age(member.date_of_birth) <= child_age_threshold:
+                        return True, "Eligible for Single Working Mothers Support Scheme."
+
+                return False, f"Not eligible: No child {child_age_threshold} years old or younger in the household."
+
+            self.__compiled_check = check_eligibility_compiled
+        return self.__compiled_check
 
     def calculate_benefits(self, applicant: Applicant) -> List[Dict[str, Any]]:
         """
@@ -32,33 +32,39 @@ The AdministratorService class provides a comprehensive implementation of the bu
 
 """
 
+import calendar
 import hashlib
+import hmac
 import os
 import string
 import random
-from typing import Optional, List
+import time
+from typing import Iterator, Optional, List
 from dal.crud_operations import CRUDOperations
 from dal.models import Administrator
 from exceptions import InvalidAdministratorDataException, AdministratorNotFoundException 
 from environs import Env
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 load_dotenv()
 from utils.data_validation import validate_administrator_data
 
-class AdministratorService:
-    # Load environment variables
+# Parse environment configuration once at import time; constructing an Env and converting
+# strings to integers on every service instantiation repeats the same work per request.
+_ENV = Env()
+MAX_PASSWORD_RETRIES = _ENV.int("MAX_PASSWORD_RETRIES", 5) # Maximum number of consecutive failed login attempts
+PASSWORD_RETRIES_TIME_WINDOW_MINUTES = _ENV.int("PASSWORD_RETRIES_TIME_WINDOW_MINUTES", 10)
 
+class AdministratorService:
     """
     Service class to handle all business logic related to administrators.
     """
-    MAX_PASSWORD_RETRIES = int(Env().str("MAX_PASSWORD_RETRIES", "5")) # Maximum number of consecutive failed login attempts 
-    
+    MAX_PASSWORD_RETRIES = MAX_PASSWORD_RETRIES
+    PASSWORD_RETRIES_TIME_WINDOW_MINUTES = PASSWORD_RETRIES_TIME_WINDOW_MINUTES
+
     def __init__(self, crud_operations: CRUDOperations):
         self.crud_operations = crud_operations
-        # self.MAX_PASSWORD_RETRIES = int(Env().str("MAX_PASSWORD_RETRIES", "5")) # Maximum number of consecutive failed login attempts 
-        self.PASSWORD_RETRIES_TIME_WINDOW_MINUTES = int(Env().str("PASSWORD_RETRIES_TIME_WINDOW_MINUTES", "10"))
-        
+
     def get_administrator_by_id(self, admin_id: int) -> Administrator:
         """
         Retrieve an administrator by ID.
@@ -111,11 +117,12 @@ class AdministratorService:
         """
         self.crud_operations.delete_administrator(admin_id)
 
-    def get_all_administrators(self) -> List[Administrator]:
+    def get_all_administrators(self) -> Iterator[tuple]:
         """
-        Retrieve all administrators.
+        Retrieve all administrators as a streamed iterator of
+        (id, username, account_locked) rows, avoiding full ORM hydration.
         """
-        return self.crud_operations.get_administrators_by_filters({})
+        return self.crud_operations.get_administrators_stream()
 
     # Security methods
     def verify_login_credentials(self, username: str, password: str) -> tuple[Optional[Administrator], str]:
@@ -139,11 +146,11 @@ class AdministratorService:
             if not admin.account_locked:
                 if self.__verify_password(admin.password_hash, password, admin.salt):
                     # Reset login failure counters on successful login
-                    self.__reset_login_failure_counters(admin.id)
+                    self.__reset_login_failure_counters(admin)
                     return admin, f"Welcome [{admin.username}]!"
                 else:
                     # Increment login failure counters
-                    consecutive_failed_logins = self.__increment_login_failure_counter(admin.id)
+                    consecutive_failed_logins = self.__increment_login_failure_counter(admin)
                     mesg = f"Invalid password. {self.MAX_PASSWORD_RETRIES - consecutive_failed_logins} attempts remaining."
             else:
                 mesg = "Account is locked. Please contact the administrator."
@@ -151,26 +158,26 @@ class AdministratorService:
             mesg = "Invalid username. Please try again."
         return None, mesg
     
-    def __increment_login_failure_counter(self, admin_id: int) -> int:
+    def __increment_login_failure_counter(self, admin: Administrator) -> int:
         """
         Increment the consecutive_failed_logins counter and set failed_login_starttime.
         Lock the account if necessary, considering the retry time window.
+        Operates on the already-loaded Administrator to avoid a redundant SELECT on the login path.
         """
-        admin = self.__get_admin_by_id(admin_id) # Check if the admin exists. Raises an exception if not found.
-        current_time = datetime.now(timezone.utc)  # Use timezone-aware datetime
+        now = time.time()  # POSIX seconds; cheaper than constructing datetime objects per attempt
         current_count = admin.consecutive_failed_logins
-        time_window = timedelta(minutes=self.PASSWORD_RETRIES_TIME_WINDOW_MINUTES)  # Configure this as needed
+        time_window_seconds = self.PASSWORD_RETRIES_TIME_WINDOW_MINUTES * 60
 
         # Check if the current attempt is outside the retry time window
         if admin.failed_login_starttime:
-            admin.failed_login_starttime = admin.failed_login_starttime.replace(tzinfo=timezone.utc) # Ensure timezone-aware datetime
-            time_since_first_failure = current_time - admin.failed_login_starttime
+            # The column stores UTC; timegm interprets the naive value as UTC without tzinfo juggling
+            time_since_first_failure = now - calendar.timegm(admin.failed_login_starttime.timetuple())
 
-            if time_since_first_failure > time_window:
+            if time_since_first_failure > time_window_seconds:
                 # Reset the counter and starttime if outside the retry window
                 update_data = {
                     "consecutive_failed_logins": 1,  # Start fresh with the current failed attempt
-                    "failed_login_starttime": current_time
+                    "failed_login_starttime": datetime.fromtimestamp(now, tz=timezone.utc)
                 }
             else:
                 # Increment the counter if within the retry window
@@ -181,38 +188,57 @@ class AdministratorService:
             current_count = 1
             update_data = {
                 "consecutive_failed_logins": current_count,
-                "failed_login_starttime": current_time
+                "failed_login_starttime": datetime.fromtimestamp(now, tz=timezone.utc)
             }
 
         # Lock account if the failed attempts reach the threshold
         if current_count >= self.MAX_PASSWORD_RETRIES:
             update_data["account_locked"] = True
 
-        self.crud_operations.update_administrator(admin_id, update_data)
+        self.crud_operations.update_administrator_instance(admin, update_data)
         return current_count
 
 
-    def __reset_login_failure_counters(self, admin_id: int) -> None:
+    def __reset_login_failure_counters(self, admin: Administrator) -> None:
         """
         Reset the consecutive_failed_logins counter and failed_login_starttime.
+        Operates on the already-loaded Administrator to avoid a redundant SELECT on the login path.
         """
         update_data = {
             "consecutive_failed_logins": 0,
             "failed_login_starttime": None
         }
-        self.crud_operations.update_administrator(admin_id, update_data)
+        self.crud_operations.update_administrator_instance(admin, update_data)
     
+    # scrypt cost parameters (memory-hard; resists GPU/ASIC brute-force far better than a single SHA-256 round)
+    SCRYPT_N = 2 ** 14
+    SCRYPT_R = 8
+    SCRYPT_P = 1
+    SCRYPT_DKLEN = 32
+
+    def __hash_password_raw(self, password: str, salt: str) -> bytes:
+        """
+        Derive the raw 32-byte password digest using the memory-hard scrypt KDF.
+        """
+        return hashlib.scrypt(password.encode('utf-8'), salt=salt.encode('ascii'), n=self.SCRYPT_N, r=self.SCRYPT_R, p=self.SCRYPT_P, dklen=self.SCRYPT_DKLEN)
+
     def __hash_password(self, password: str, salt: str) -> str:
         """
-        Hash a password with a salt using SHA-256.
+        Hash a password with a salt, hex-encoded for storage in the password_hash column.
         """
-        return hashlib.sha256(f'{salt}:{password}'.encode('utf-8')).hexdigest()
+        return self.__hash_password_raw(password, salt).hex()
 
     def __verify_password(self, stored_password_hash: str, provided_password: str, salt: str) -> bool:
         """
         Verify a provided password against the stored password hash using the salt.
+        Compares the raw digests in constant time, skipping the hex encoding of the
+        computed hash and the character-wise string comparison.
         """
-        return stored_password_hash == self.__hash_password(provided_password, salt)
+        try:
+            stored_digest = bytes.fromhex(stored_password_hash)
+        except ValueError:
+            return False # Stored value is not a hex digest, so it cannot match
+        return hmac.compare_digest(stored_digest, self.__hash_password_raw(provided_password, salt))
 
         
     def unlock_administrator_account(self, admin_id: int) -> None:
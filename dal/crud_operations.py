@@ -24,13 +24,13 @@ Design Patterns:
 
 """
 
-from typing import List, Dict, Optional, Tuple
-from sqlalchemy.orm import Session
+from typing import Iterator, List, Dict, Optional, Tuple
+from sqlalchemy.orm import Session, raiseload, selectinload
 from datetime import date
 from dal.models import Administrator, Applicant, HouseholdMember, Scheme, Application, SystemConfiguration
 from sqlalchemy.exc import SQLAlchemyError
 from exceptions import InvalidPaginationParameterException, InvalidSortingParameterException
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, desc, select
 
 
 class CRUDOperations:
@@ -68,8 +68,12 @@ class CRUDOperations:
 
         Returns:
             Optional[Administrator]: The Administrator object if found, otherwise None.
+
+        Relationships are guarded with raiseload so any unplanned lazy load fails
+        loudly instead of silently issuing N+1 queries; callers that need related
+        objects must ask for them with an explicit eager-load option.
         """
-        return self.db_session.query(Administrator).filter(Administrator.id == admin_id).first()
+        return self.db_session.query(Administrator).options(raiseload('*')).filter(Administrator.id == admin_id).first()
 
     def get_administrator_by_username(self, username: str) -> Optional[Administrator]:
         """
@@ -80,8 +84,10 @@ class CRUDOperations:
 
         Returns:
             Optional[Administrator]: The Administrator object if found, otherwise None.
+
+        Relationships are guarded with raiseload; see get_administrator.
         """
-        return self.db_session.query(Administrator).filter(Administrator.username == username).first()
+        return self.db_session.query(Administrator).options(raiseload('*')).filter(Administrator.username == username).first()
 
     def get_administrators_by_filters(self, filters: Dict) -> List[Administrator]:
         """
@@ -113,6 +119,44 @@ class CRUDOperations:
         self.db_session.commit()
         return self.get_administrator(admin_id)
 
+    def get_administrators_stream(self, columns: Tuple[str, ...] = ('id', 'username', 'account_locked')) -> Iterator[Tuple]:
+        """
+        Stream administrator rows without materializing full ORM objects.
+
+        Selects only the requested columns and fetches rows in batches, so large
+        listings neither hydrate unused columns nor hold every row in memory at once.
+
+        Args:
+            columns (Tuple[str, ...]): The Administrator column names to select.
+
+        Returns:
+            Iterator[Tuple]: An iterator of row tuples in the requested column order.
+        """
+        selected_columns = [getattr(Administrator, column) for column in columns]
+        return self.db_session.execute(
+            select(*selected_columns).execution_options(stream_results=True, yield_per=1000)
+        )
+
+    def update_administrator_instance(self, admin: Administrator, update_data: Dict) -> Administrator:
+        """
+        Apply updates to an already-loaded Administrator instance.
+
+        Unlike update_administrator, this mutates the attached ORM object directly
+        instead of re-querying by ID, saving a SELECT round-trip when the caller
+        already holds the Administrator.
+
+        Args:
+            admin (Administrator): The Administrator instance to update.
+            update_data (Dict): A dictionary of the data to update.
+
+        Returns:
+            Administrator: The updated Administrator object.
+        """
+        for attribute, value in update_data.items():
+            setattr(admin, attribute, value)
+        self.db_session.commit()
+        return admin
+
     def delete_administrator(self, admin_id: int) -> None:
         """
         Delete an administrator by ID.
@@ -256,6 +300,27 @@ class CRUDOperations:
         
     
 
+    def get_applicants_by_ids(self, applicant_ids: List[int]) -> List[Applicant]:
+        """
+        Retrieve multiple applicants by ID with their household members eager-loaded.
+
+        One SELECT fetches the applicants and one batched SELECT ... IN fetches all
+        their household members, so eligibility checks over the batch never fall
+        back to per-applicant lazy loads (the classic N+1).
+
+        Args:
+            applicant_ids (List[int]): The IDs of the applicants to load.
+
+        Returns:
+            List[Applicant]: The matching Applicant objects with household_members populated.
+        """
+        return (
+            self.db_session.query(Applicant)
+            .filter(Applicant.id.in_(applicant_ids))
+            .options(selectinload(Applicant.household_members))
+            .all()
+        )
+
     def get_applicants_by_filters(self, filters: Dict) -> List[Applicant]:
         """
         Retrieve multiple applicants based on common filters.
@@ -53,7 +53,7 @@ class Administrator(Base):
     __tablename__ = 'Administrators'
 
     id: int = Column(Integer, primary_key=True, index=True)
-    username: str = Column(String(255), unique=True, nullable=False)
+    username: str = Column(String(255), unique=True, index=True, nullable=False) # Unique index: login looks admins up by username on every request
     password_hash: str = Column(String(255), nullable=False)
     salt: str = Column(String(255), nullable=False) 
     role: str = Column(String(50), default='admin')
@@ -2,7 +2,90 @@
 
 # test_schemes_manager.py
 import pytest
+from datetime import datetime
 from bl.schemes.schemes_manager import SchemesManager
 from exceptions import SchemeNotFoundException
 
 
+def test_check_scheme_eligibility_for_applicants(scheme_manager, applicant_service, test_administrator, senior_citizen_assistance_scheme):
+    """
+    Test batch eligibility checking for one scheme over several applicants.
+    The batch results must match the per-applicant check, and IDs that match no
+    applicant are silently dropped from the result dict.
+    """
+    eligible_applicant = applicant_service.create_applicant({
+        "name": "Elderly Applicant",
+        "employment_status": "unemployed",
+        "sex": "M",
+        "date_of_birth": datetime(1950, 1, 1),  # Above the age threshold of 65 (eligible)
+        "marital_status": "single",
+        "created_by_admin_id": test_administrator.id
+    })
+    ineligible_applicant = applicant_service.create_applicant({
+        "name": "Young Applicant",
+        "employment_status": "employed",
+        "sex": "F",
+        "date_of_birth": datetime(1990, 1, 1),  # Below the age threshold of 65 (not eligible)
+        "marital_status": "single",
+        "created_by_admin_id": test_administrator.id
+    })
+    unknown_applicant_id = ineligible_applicant.id + 999999  # Matches no applicant
+
+    results = scheme_manager.check_scheme_eligibility_for_applicants(
+        senior_citizen_assistance_scheme,
+        [eligible_applicant.id, ineligible_applicant.id, unknown_applicant_id]
+    )
+
+    # Unknown IDs load no applicant and are silently dropped from the results
+    assert set(results.keys()) == {eligible_applicant.id, ineligible_applicant.id}
+    assert results[eligible_applicant.id].report["is_eligible"] == True
+    assert results[ineligible_applicant.id].report["is_eligible"] == False
+
+    # Batch results must match the per-applicant check
+    for applicant in [eligible_applicant, ineligible_applicant]:
+        single_result = scheme_manager.check_scheme_eligibility_for_applicant(senior_citizen_assistance_scheme, applicant)
+        assert results[applicant.id].report == single_result.report
+
+
+def test_check_eligibility_batch_contract(scheme_eligibility_checker_factory, applicant_service, test_administrator, senior_citizen_assistance_scheme):
+    """
+    Test the batch eligibility seam on SchemeEligibilityChecker: outcomes are
+    positionally aligned with the input applicants, and the batch call
+    pre-populates the per-applicant memo cache so a subsequent
+    _calculate_benefits does not re-run the predicate.
+    """
+    eligible_applicant = applicant_service.create_applicant({
+        "name": "Elderly Applicant",
+        "employment_status": "unemployed",
+        "sex": "M",
+        "date_of_birth": datetime(1950, 1, 1),  # Above the age threshold of 65 (eligible)
+        "marital_status": "single",
+        "created_by_admin_id": test_administrator.id
+    })
+    ineligible_applicant = applicant_service.create_applicant({
+        "name": "Young Applicant",
+        "employment_status": "employed",
+        "sex": "F",
+        "date_of_birth": datetime(1990, 1, 1),  # Below the age threshold of 65 (not eligible)
+        "marital_status": "single",
+        "created_by_admin_id": test_administrator.id
+    })
+    applicants = [eligible_applicant, ineligible_applicant]
+
+    checker = scheme_eligibility_checker_factory.load_scheme_eligibility_checker(senior_citizen_assistance_scheme)
+    outcomes = checker._check_eligibility_batch(applicants)
+
+    # Outcomes are positionally aligned with the input list and match single checks
+    assert outcomes == [checker._check_eligibility(applicant) for applicant in applicants]
+    assert outcomes[0] == (True, "Eligible for Senior Citizen Assistance Scheme.")
+    assert outcomes[1] == (False, "Not eligible for Senior Citizen Assistance Scheme.")
+
+    # The batch call pre-populated the memo cache, so _calculate_benefits must not
+    # re-run the checker's compiled predicate
+    predicate_calls = []
+    compiled_check = checker._compiled_check
+    checker._compiled_check = lambda applicant: predicate_calls.append(applicant) or compiled_check(applicant)
+
+    benefits = checker._calculate_benefits(eligible_applicant)
+    assert predicate_calls == []
+    assert {benefit["benefit_name"] for benefit in benefits} == {"cpf_top_up", "cdc_voucher"}
@@ -59,6 +59,51 @@ def test_get_administrators_by_filters(crud_operations):
     assert any(admin.username == "admin_filter_test" for admin in admins)
 
 
+def test_get_administrators_stream(crud_operations):
+    """
+    Test streaming administrators as row tuples of the selected columns.
+    """
+    crud_operations.create_administrator(username="admin_stream_test", password_hash="pass", salt="salt")
+    rows = list(crud_operations.get_administrators_stream())
+    assert any(row.username == "admin_stream_test" for row in rows)
+    assert all(len(row) == 3 for row in rows)  # (id, username, account_locked)
+
+
+
+def test_get_applicants_by_ids(crud_operations, test_administrator):
+    """
+    Test retrieving a batch of applicants by ID with household members eager-loaded.
+    """
+    applicant_data = {
+        "name": "Batch Applicant",
+        "employment_status": "employed",
+        "sex": "F",
+        "date_of_birth": datetime(1980, 3, 5),
+        "marital_status": "single",
+        "created_by_admin_id": test_administrator.id
+    }
+    household_members_data = [
+        {"name": "Batch Child", "relation": "child", "date_of_birth": datetime(2015, 4, 10)},
+        {"name": "Batch Parent", "relation": "parent", "date_of_birth": datetime(1950, 7, 20)},
+    ]
+    applicant_with_household = crud_operations.create_applicant(applicant_data, household_members_data)
+    applicant_without_household = crud_operations.create_applicant({
+        "name": "Solo Applicant",
+        "employment_status": "unemployed",
+        "sex": "M",
+        "date_of_birth": datetime(1975, 9, 1),
+        "marital_status": "single",
+        "created_by_admin_id": test_administrator.id
+    })
+
+    applicants = crud_operations.get_applicants_by_ids([applicant_with_household.id, applicant_without_household.id])
+    assert len(applicants) == 2
+
+    applicants_by_id = {applicant.id: applicant for applicant in applicants}
+    # Household members come back populated by the eager load
+    assert {member.name for member in applicants_by_id[applicant_with_household.id].household_members} == {"Batch Child", "Batch Parent"}
+    assert applicants_by_id[applicant_without_household.id].household_members == []
+
 
 # Test CRUD operations for the Applicant model
 def test_create_applicant(crud_operations, test_administrator):
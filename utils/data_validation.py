@@ -14,19 +14,19 @@ from typing import Tuple
 from utils.date_utils import is_future_date
 from utils.date_utils import convert_to_datetime
 
+# Built once at import: this validator runs on every administrator write, so the
+# required-field set should not be re-allocated per call.
+_ADMIN_REQUIRED_FIELDS_FOR_CREATE = ('username', 'password_hash', 'salt')
+
 def validate_administrator_data(administrator_data: dict, for_create_mode: bool) -> Tuple[bool, str]:
     """
-    Validate administrator data to ensure all required fields are present and correctly formatted if for_create_mode is True. 
+    Validate administrator data to ensure all required fields are present and correctly formatted if for_create_mode is True.
     In contrast, we do not need all the fields to be present for other types of queries like select, update or delete.
     Returns True if all fields are valid, False otherwise and provides a reason for failure.
     """
-    # Required fields
-    required_fields_for_create_mode = ['username', 'password_hash', 'salt']
-
-
     if (for_create_mode):
         # Check for missing or empty required fields
-        for field in required_fields_for_create_mode:
+        for field in _ADMIN_REQUIRED_FIELDS_FOR_CREATE:
             if field not in administrator_data or administrator_data[field] is None:
                 return False, f"Missing or empty field: {field}"
 